@@ -10,6 +10,9 @@ HOMEPAGE = ROOT / "index.html"
 START = "<!-- OPPORTUNITIES:START -->"
 END = "<!-- OPPORTUNITIES:END -->"
 
+OPPS_BLOCK_RE = re.compile(re.escape(START) + r"[\s\S]*?" + re.escape(END))
+OPP_COUNT_RE = re.compile(r'(<span[^>]+id="oppCount"[^>]*>)([^<]*)(</span>)')
+
 
 def safe(s):
     return (s or "").strip()
@@ -32,14 +35,16 @@ def days_left(deadline_date):
     return (deadline_date - today).days
 
 
+HTML_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+})
+
+
 def escape_html(text):
-    return (
-        (text or "")
-        .replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-    )
+    return (text or "").translate(HTML_ESCAPE_TABLE)
 
 
 def format_deadline(deadline_iso):
@@ -88,7 +93,7 @@ def card_html(opp):
 
     url = safe(opp.get("url"))
     if url.startswith("https://eosguidehub.com"):
-        url = url.replace("https://eosguidehub.com", "")
+        url = url[len("https://eosguidehub.com"):]
     if url and not url.startswith("/"):
         url = "/" + url
     if url.startswith("/articles/") and not url.endswith(".html"):
@@ -150,16 +155,10 @@ def main():
     if START not in homepage or END not in homepage:
         raise SystemExit("Missing OPPORTUNITIES markers in index.html")
 
-    pattern = re.compile(re.escape(START) + r"[\s\S]*?" + re.escape(END))
-    homepage = pattern.sub(f"{START}\n{cards}\n{END}", homepage)
+    homepage = OPPS_BLOCK_RE.sub(f"{START}\n{cards}\n{END}", homepage)
 
     # Update the initial count in raw HTML so it’s not “(0)”
-    homepage = re.sub(
-        r'(<span[^>]+id="oppCount"[^>]*>)([^<]*)(</span>)',
-        rf"\g<1>({len(opps)})\g<3>",
-        homepage,
-        count=1,
-    )
+    homepage = OPP_COUNT_RE.sub(rf"\g<1>({len(opps)})\g<3>", homepage, count=1)
 
     HOMEPAGE.write_text(homepage, encoding="utf-8")
     print(f"Pre-rendered {len(opps_render)} cards into index.html (total in JSON: {len(opps)})")
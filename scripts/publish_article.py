@@ -1,61 +1,76 @@
 import os
 import re
 import json
-from datetime import datetime
-import markdown
+import csv
+import sys
+import functools
+import hashlib
+import string
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
 
 
 # ─────────────────────────────────────────────────────────────────
 # ISSUE BODY PARSER
 # ─────────────────────────────────────────────────────────────────
 
-def get_field(body: str, label: str) -> str:
+def parse_all_fields(body: str) -> dict[str, str]:
     """
     GitHub issue forms render fields like:
 
     ### Label
     value
 
-    Capture until next ### or end.
+    Collects every ### section in a single pass over the body: {label: value},
+    each value running until the next ### or the end.
     """
-    pattern = rf"### {re.escape(label)}\n(.*?)(?=\n### |\Z)"
-    m = re.search(pattern, body, flags=re.S)
-    if not m:
-        return ""
-    val = m.group(1).strip()
-    if val == "_No response_":
-        return ""
-    return val
+    out = {}
+    # Leading "\n" so a heading on the very first line is split off too
+    for part in ("\n" + body).split("\n### ")[1:]:
+        label, _, val = part.partition("\n")
+        val = val.strip()
+        out.setdefault(sys.intern(label.strip()), "" if val == "_No response_" else val)
+    return out
+
+
+BULLET_RE = re.compile(r"^[-*]\s*")
+# "2) - Step" -> "Step": optional step number, then optional bullet
+STEP_PREFIX_RE = re.compile(r"^(?:\d+\)\s*)?(?:[-*]\s*)?")
+MD_LINK_RE = re.compile(r'\[([^\]]+)\]\((mailto:[^\)]+|https?://[^\)]+)\)')
+ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
 
 def parse_lines(text: str) -> list[str]:
     if not text:
         return []
-    out = []
-    for line in text.splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        line = re.sub(r"^[-*]\s*", "", line)
-        out.append(line)
-    return out
+    return [
+        BULLET_RE.sub("", line, count=1) if line[0] in "-*" else line
+        for line in (raw.strip() for raw in text.splitlines())
+        if line
+    ]
+
+
+def md_link_to_html(m: re.Match) -> str:
+    text, url = m.group(1), m.group(2)
+    if url.startswith("mailto:"):
+        return f'<a href="{url}">{text}</a>'
+    return f'<a href="{url}" target="_blank" rel="noopener noreferrer">{text}</a>'
+
+
+def format_step(line: str) -> str:
+    """One non-blank, stripped "How to file" line -> list item HTML."""
+    # Only run the prefix regex when the line can actually match it
+    if line[0].isdigit() or line[0] in "-*":
+        line = STEP_PREFIX_RE.sub("", line, count=1)
+    # Convert inline markdown links to HTML (escape the plain text first)
+    return MD_LINK_RE.sub(md_link_to_html, escape_html(line))
 
 
 def parse_steps(text: str) -> list[str]:
     if not text:
         return []
-    out = []
-    for line in text.splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        line = re.sub(r"^\d+\)\s*", "", line)
-        line = re.sub(r"^[-*]\s*", "", line)
-        # Convert inline markdown links to HTML
-        line = re.sub(r'\[([^\]]+)\]\((mailto:[^\)]+)\)', r'<a href="\2">\1</a>', line)
-        line = re.sub(r'\[([^\]]+)\]\((https?://[^\)]+)\)', r'<a href="\2" target="_blank" rel="noopener noreferrer">\1</a>', line)
-        out.append(line)
-    return out
+    return [format_step(line) for line in (raw.strip() for raw in text.splitlines()) if line]
 
 
 def parse_faqs(text: str) -> list[tuple[str, str]]:
@@ -74,38 +89,37 @@ def parse_faqs(text: str) -> list[tuple[str, str]]:
         return []
 
     faqs: list[tuple[str, str]] = []
-    q = ""
-    a_lines: list[str] = []
+    q_lines: list[str] = []  # non-blank question lines only
+    a_lines: list[str] = []  # non-blank answer lines only
     mode = None  # "q" or "a"
 
     for raw in text.splitlines():
         line = raw.strip()
         if not line:
-            # keep blank lines inside answers (optional)
-            if mode == "a":
-                a_lines.append("")
             continue
 
-        low = line.lower()
+        prefix = line[:2]
 
-        if low.startswith("q:"):
+        if prefix in ("Q:", "q:"):
             # save previous pair if complete
-            if q and a_lines:
-                a = " ".join([x for x in a_lines if x != ""]).strip()
-                faqs.append((q.strip(), a))
+            if q_lines and mode == "a":
+                faqs.append((" ".join(q_lines), " ".join(a_lines)))
             q = line[2:].strip()
+            q_lines = [q] if q else []
             a_lines = []
             mode = "q"
             continue
 
-        if low.startswith("a:"):
+        if prefix in ("A:", "a:"):
             mode = "a"
-            a_lines.append(line[2:].strip())
+            a = line[2:].strip()
+            if a:
+                a_lines.append(a)
             continue
 
         # continuation lines
         if mode == "q":
-            q += " " + line
+            q_lines.append(line)
         elif mode == "a":
             a_lines.append(line)
         else:
@@ -113,9 +127,8 @@ def parse_faqs(text: str) -> list[tuple[str, str]]:
             pass
 
     # flush last pair
-    if q and a_lines:
-        a = " ".join([x for x in a_lines if x != ""]).strip()
-        faqs.append((q.strip(), a))
+    if q_lines and mode == "a":
+        faqs.append((" ".join(q_lines), " ".join(a_lines)))
 
     return faqs
 
@@ -123,39 +136,36 @@ def parse_faqs(text: str) -> list[tuple[str, str]]:
 def normalize_states(text: str) -> list[str]:
     if not text:
         return []
-    parts = [p.strip() for p in re.split(r"[\n,]+", text) if p.strip() and p.strip() != "_No response_"]
-    if any(p.lower() == "nationwide" for p in parts):
-        return ["Nationwide"]
-    seen = set()
-    out = []
-    for p in parts:
-        if p not in seen:
-            seen.add(p)
-            out.append(p)
-    return out
+    states = {}  # used as an ordered set
+    for p in text.replace("\n", ",").split(","):
+        p = p.strip()
+        if not p or p == "_No response_":
+            continue
+        if p.lower() == "nationwide":
+            return ["Nationwide"]
+        states[p] = None
+    return list(states)
+
 
+PipeRow = namedtuple("PipeRow", "label value notes")
 
-def parse_pipe_rows(text: str) -> list[dict]:
+
+def parse_pipe_rows(text: str) -> list[PipeRow]:
     """
     For lines like:
       Label | Value | Notes(optional)
-    Returns: [{"label":..., "value":..., "notes":...}, ...]
+    Returns: [PipeRow(label, value, notes), ...]
     """
     if not text:
         return []
     rows = []
-    for raw in text.splitlines():
-        line = raw.strip()
-        if not line:
+    # QUOTE_NONE: a '"' in benefit text is literal, not a CSV quote
+    for cells in csv.reader(text.splitlines(), delimiter="|", quoting=csv.QUOTE_NONE):
+        cells = [c.strip() for c in cells]
+        if not any(cells):
             continue
-        parts = [p.strip() for p in line.split("|")]
-        if len(parts) == 1:
-            rows.append({"label": parts[0], "value": "", "notes": ""})
-            continue
-        label = parts[0] if len(parts) >= 1 else ""
-        value = parts[1] if len(parts) >= 2 else ""
-        notes = parts[2] if len(parts) >= 3 else ""
-        rows.append({"label": label, "value": value, "notes": notes})
+        cells += ["", ""]
+        rows.append(PipeRow(cells[0], cells[1], cells[2]))
     return rows
 
 
@@ -163,7 +173,30 @@ def parse_pipe_rows(text: str) -> list[dict]:
 # HTML BUILDERS (ONLY RENDER IF FILLED)
 # ─────────────────────────────────────────────────────────────────
 
-def build_at_a_glance(f: dict) -> str:
+HTML_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
+
+
+def escape_html(text: str) -> str:
+    """Escape plain-text issue fields for use in HTML text and attribute values."""
+    return (text or "").translate(HTML_ESCAPE_TABLE)
+
+
+# Static markup around each builder's dynamic rows, joined once at import
+GLANCE_PREFIX = """
+    <section class="glance-card" aria-label="At a glance">
+      <div class="glance-grid">"""
+GLANCE_SUFFIX = """</div>
+    </section>
+    """
+
+
+def build_at_a_glance(eligible_states: str, deadline: str, benefit_summary: str, official_website: str) -> str:
     def row(label: str, value_html: str) -> str:
         return f"""
         <div class="glance-row">
@@ -171,132 +204,132 @@ def build_at_a_glance(f: dict) -> str:
           <span class="glance-value">{value_html}</span>
         </div>"""
 
-    rows = ""
+    rows = []
 
-    states = normalize_states(f.get("eligible_states", ""))
+    states = normalize_states(eligible_states)
     if states:
-        rows += row("Applies to", ", ".join(states))
+        rows.append(row("Applies to", escape_html(", ".join(states))))
 
-    if f.get("deadline"):
-        rows += row("Main deadline", f["deadline"])
+    if deadline:
+        rows.append(row("Main deadline", escape_html(deadline)))
 
-    benefit_summary = f.get("benefit_summary", "")
     if benefit_summary:
-        rows += row("Benefit", benefit_summary)
+        rows.append(row("Benefit", escape_html(benefit_summary)))
 
-    if f.get("official_website"):
-        url = f["official_website"]
-        rows += row("Official site", f'<a href="{url}" target="_blank" rel="noopener noreferrer">{url}</a>')
+    if official_website:
+        url = escape_html(official_website)
+        rows.append(row("Official site", f'<a href="{url}" target="_blank" rel="noopener noreferrer">{url}</a>'))
 
     if not rows:
         return ""
 
-    return f"""
-    <section class="glance-card" aria-label="At a glance">
-      <div class="glance-grid">{rows}</div>
+    return GLANCE_PREFIX + "".join(rows) + GLANCE_SUFFIX
+
+
+KEY_DATE_FIELDS = ("deadline", "optout_deadline", "objection_deadline", "hearing_date")
+
+KEY_DATES_PREFIX = """
+    <section class="section">
+      <h2 class="section-title">Key dates</h2>
+      <div class="table-wrap">
+        <table class="deadline-table">
+          <thead>
+            <tr>
+              <th>Action</th>
+              <th>Date</th>
+              <th>What it means</th>
+            </tr>
+          </thead>
+          <tbody>"""
+KEY_DATES_SUFFIX = """</tbody>
+        </table>
+      </div>
     </section>
     """
 
 
-def build_key_dates_table(f: dict) -> str:
-    deadline = f.get("deadline", "")
-    optout = f.get("optout_deadline", "")
-    objection = f.get("objection_deadline", "")
-    hearing = f.get("hearing_date", "")
+def build_key_dates_table(deadline: str, optout: str, objection: str, hearing: str) -> str:
+    deadline, optout, objection, hearing = (escape_html(v) for v in (deadline, optout, objection, hearing))
 
     if not any([deadline, optout, objection, hearing]):
         return ""
 
-    rows = ""
+    rows = []
     if deadline:
-        rows += f"""
+        rows.append(f"""
         <tr>
           <td>Claim deadline</td>
           <td class="date-cell urgent">{deadline}</td>
           <td>Last day to file a claim</td>
-        </tr>"""
+        </tr>""")
     if optout:
-        rows += f"""
+        rows.append(f"""
         <tr>
           <td>Opt out</td>
           <td class="date-cell">{optout}</td>
           <td>Keep your right to sue separately</td>
-        </tr>"""
+        </tr>""")
     if objection:
-        rows += f"""
+        rows.append(f"""
         <tr>
           <td>Object</td>
           <td class="date-cell">{objection}</td>
           <td>Tell the court you disagree</td>
-        </tr>"""
+        </tr>""")
     if hearing:
-        rows += f"""
+        rows.append(f"""
         <tr>
           <td>Final hearing</td>
           <td class="date-cell">{hearing}</td>
           <td>Judge decides whether to approve</td>
-        </tr>"""
+        </tr>""")
 
-    return f"""
+    return KEY_DATES_PREFIX + "".join(rows) + KEY_DATES_SUFFIX
+
+
+BENEFITS_PREFIX = """
     <section class="section">
-      <h2 class="section-title">Key dates</h2>
-      <div class="table-wrap">
-        <table class="deadline-table">
-          <thead>
-            <tr>
-              <th>Action</th>
-              <th>Date</th>
-              <th>What it means</th>
-            </tr>
-          </thead>
-          <tbody>{rows}</tbody>
-        </table>
+      <h2 class="section-title">What you can get</h2>
+      <div class="benefit-grid">
+        """
+BENEFITS_SUFFIX = """
       </div>
     </section>
     """
 
 
-def build_benefits_section(f: dict) -> str:
-    rows = parse_pipe_rows(f.get("benefits", ""))
+def build_benefits_section(benefits: str) -> str:
+    rows = parse_pipe_rows(benefits)
     if not rows:
         return ""
 
-    cards = ""
-    for r in rows:
-        label = r.get("label", "")
-        value = r.get("value", "")
-        notes = r.get("notes", "")
+    cards = []
+    for label, value, notes in rows:
         if not (label or value or notes):
             continue
+        label, value, notes = escape_html(label), escape_html(value), escape_html(notes)
 
         big = value if value else (notes if notes else "")
         small = notes if (value and notes) else ""
 
-        cards += f"""
+        cards.append(f"""
         <div class="benefit-card">
           <h3>{label or "Benefit"}</h3>
           <p class="big">{big}</p>
           {f'<p class="small">{small}</p>' if small else ''}
         </div>
-        """
+        """)
 
     if not cards:
         return ""
 
-    return f"""
-    <section class="section">
-      <h2 class="section-title">What you can get</h2>
-      <div class="benefit-grid">
-        {cards}
-      </div>
-    </section>
-    """
+    return BENEFITS_PREFIX + "".join(cards) + BENEFITS_SUFFIX
 
 
 def build_bullets_section(title: str, items: list[str]) -> str:
     if not items:
         return ""
-    lis = "".join([f"<li>{i}</li>" for i in items])
+    lis = "".join([f"<li>{escape_html(i)}</li>" for i in items])
     return f"""
     <section class="section">
       <h2 class="section-title">{title}</h2>
@@ -317,54 +350,70 @@ def build_steps_section(title: str, steps: list[str]) -> str:
     """
 
 
+LINK_FIELDS = (
+    ("official_website", "Official website"),
+    ("claim_form_url", "Claim form"),
+    ("important_dates_url", "Important dates"),
+    ("faqs_url", "FAQs"),
+    ("documents_url", "Documents"),
+)
+
+LINKS_PREFIX = """
+    <section class="section">
+      <h2 class="section-title">Important links</h2>
+      <ul class="bullets">"""
+LINKS_SUFFIX = """</ul>
+    </section>
+    """
+
+
 def build_links_section(f: dict) -> str:
-    links = []
-    if f.get("official_website"):
-        links.append(("Official website", f["official_website"]))
-    if f.get("claim_form_url"):
-        links.append(("Claim form", f["claim_form_url"]))
-    if f.get("important_dates_url"):
-        links.append(("Important dates", f["important_dates_url"]))
-    if f.get("faqs_url"):
-        links.append(("FAQs", f["faqs_url"]))
-    if f.get("documents_url"):
-        links.append(("Documents", f["documents_url"]))
+    links = [(label, f[key]) for key, label in LINK_FIELDS if f.get(key)]
 
     if not links:
         return ""
 
-    items = ""
-    for label, url in links:
-        items += f'<li><a href="{url}" target="_blank" rel="noopener noreferrer">{label}</a></li>'
+    items = "".join(
+        f'<li><a href="{escape_html(url)}" target="_blank" rel="noopener noreferrer">{label}</a></li>'
+        for label, url in links
+    )
 
-    return f"""
+    return LINKS_PREFIX + items + LINKS_SUFFIX
+
+
+CONTACT_FIELDS = ("admin_phone", "admin_email", "admin_address")
+
+CONTACT_PREFIX = """
     <section class="section">
-      <h2 class="section-title">Important links</h2>
-      <ul class="bullets">{items}</ul>
+      <h2 class="section-title">Contact</h2>
+      <div class="callout">"""
+CONTACT_SUFFIX = """</div>
     </section>
     """
 
 
-def build_contact_section(f: dict) -> str:
-    phone = f.get("admin_phone", "")
-    email = f.get("admin_email", "")
-    addr = f.get("admin_address", "")
+def build_contact_section(phone: str, email: str, addr: str) -> str:
+    phone, email, addr = escape_html(phone), escape_html(email), escape_html(addr)
 
     if not any([phone, email, addr]):
         return ""
 
-    rows = ""
+    rows = []
     if phone:
-        rows += f"<div class='mini-row'><strong>Phone:</strong> {phone}</div>"
+        rows.append(f"<div class='mini-row'><strong>Phone:</strong> {phone}</div>")
     if email:
-        rows += f"<div class='mini-row'><strong>Email:</strong> {email}</div>"
+        rows.append(f"<div class='mini-row'><strong>Email:</strong> {email}</div>")
     if addr:
-        rows += f"<div class='mini-row'><strong>Mail:</strong> {addr}</div>"
+        rows.append(f"<div class='mini-row'><strong>Mail:</strong> {addr}</div>")
 
-    return f"""
+    return CONTACT_PREFIX + "".join(rows) + CONTACT_SUFFIX
+
+
+FAQ_PREFIX = """
     <section class="section">
-      <h2 class="section-title">Contact</h2>
-      <div class="callout">{rows}</div>
+      <h2 class="section-title">FAQ</h2>
+      """
+FAQ_SUFFIX = """
     </section>
     """
 
@@ -372,35 +421,33 @@ def build_contact_section(f: dict) -> str:
 def build_faq_section(faqs: list[tuple[str, str]]) -> str:
     if not faqs:
         return ""
-    blocks = ""
-    for q, a in faqs:
-        blocks += f"""
+    blocks = "".join(f"""
       <details class="faq">
-        <summary>{q}</summary>
-        <div class="faq-a">{a}</div>
-      </details>"""
-    return f"""
-    <section class="section">
-      <h2 class="section-title">FAQ</h2>
-      {blocks}
-    </section>
-    """
+        <summary>{escape_html(q)}</summary>
+        <div class="faq-a">{escape_html(a)}</div>
+      </details>""" for q, a in faqs)
+    return FAQ_PREFIX + blocks + FAQ_SUFFIX
 
 
-def build_cta_buttons(official_website: str, deadline: str) -> str:
-    if not official_website:
-        return ""
-    deadline_note = f" (deadline: {deadline})" if deadline else ""
-    return f"""
+CTA_TEMPLATE = """
     <div class="cta-row">
-      <a class="btn primary" href="{official_website}" target="_blank" rel="noopener noreferrer">
-        Go to official website{deadline_note}
+      <a class="btn primary" href="{url}" target="_blank" rel="noopener noreferrer">
+        Go to official website{note}
       </a>
       <a class="btn" href="/articles/">Browse more guides</a>
     </div>
     """
 
 
+def build_cta_buttons(official_website: str, deadline: str) -> str:
+    if not official_website:
+        return ""
+    return CTA_TEMPLATE.format(
+        url=escape_html(official_website),
+        note=" (deadline: %s)" % escape_html(deadline) if deadline else "",
+    )
+
+
 # ─────────────────────────────────────────────────────────────────
 # AFFILIATE CTA — only renders on data breach / identity articles
 # ─────────────────────────────────────────────────────────────────
@@ -416,20 +463,8 @@ DATA_BREACH_KEYWORDS = [
     "tracking pixel", "meta pixel", "facebook pixel", "third party tracking",
 ]
 
-def build_incogni_cta(f: dict) -> str:
-    """Render an Incogni affiliate block only on data breach / identity articles."""
-    haystack = " ".join([
-        f.get("title", ""),
-        f.get("blurb", ""),
-        f.get("what_happened", ""),
-        f.get("extra_details", ""),
-        f.get("eligible_states", ""),
-    ]).lower()
-
-    if not any(kw in haystack for kw in DATA_BREACH_KEYWORDS):
-        return ""
-
-    return f"""
+# The block has no per-article content, so it is rendered once at import
+INCOGNI_CTA_HTML = f"""
     <section class="section" style="margin-top:2rem;">
       <div style="background:linear-gradient(135deg,#f0f9ff,#f5f3ff);border:1px solid #c7d2fe;border-radius:18px;padding:20px 22px;">
         <div style="display:flex;align-items:flex-start;gap:14px;">
@@ -450,186 +485,176 @@ def build_incogni_cta(f: dict) -> str:
     """
 
 
-# ─────────────────────────────────────────────────────────────────
-# MAIN PAGE BUILDER
-# ─────────────────────────────────────────────────────────────────
+def build_incogni_cta(f: dict) -> str:
+    """Render an Incogni affiliate block only on data breach / identity articles."""
+    haystack = " ".join([
+        f.get("title", ""),
+        f.get("blurb", ""),
+        f.get("what_happened", ""),
+        f.get("extra_details", ""),
+        f.get("eligible_states", ""),
+    ]).lower()
 
-def build_page(f: dict) -> str:
-    title = f.get("title", "Article")
-    slug = f.get("slug", "article")
-    blurb = f.get("blurb", "")
-    last_updated = f.get("last_updated", "")
-    official_website = f.get("official_website", "")
-    hero_image = f.get("hero_image", "")
-    hero_credit = f.get("hero_credit", "")
+    if not any(kw in haystack for kw in DATA_BREACH_KEYWORDS):
+        return ""
 
-    what_happened_md = f.get("what_happened", "")
-    class_period = f.get("class_period", "")
-    payment_timing = f.get("payment_timing", "")
-    extra_details_md = f.get("extra_details", "")
+    return INCOGNI_CTA_HTML
 
-    eligibility_items = parse_lines(f.get("eligibility", ""))
-    proof_items = parse_lines(f.get("proof_required", ""))
-    steps = parse_steps(f.get("how_to_file", ""))
-    faqs = parse_faqs(f.get("faqs", ""))
-    # Use ISO dates for schema (keeps Google happier than mixed formats)
-    iso_last_updated = to_iso_date(last_updated)
 
-    # ----------------------------
-    # Structured data (JSON-LD)
-    # ----------------------------
-    breadcrumb_ld = {
-        "@type": "BreadcrumbList",
-        "itemListElement": [
-            {"@type": "ListItem", "position": 1, "name": "Home", "item": "https://eosguidehub.com/"},
-            {"@type": "ListItem", "position": 2, "name": "Articles", "item": "https://eosguidehub.com/articles/"},
-            {"@type": "ListItem", "position": 3, "name": title, "item": f"https://eosguidehub.com/articles/{slug}.html"},
-        ],
-    }
+# ─────────────────────────────────────────────────────────────────
+# MARKDOWN (cached by content hash)
+# ─────────────────────────────────────────────────────────────────
 
-    article_ld = {
-        "@type": "Article",
-        "headline": title,
-        "description": meta_description if "meta_description" in locals() else blurb.strip().replace("\n", " ")[:155].rstrip(),
-        "datePublished": iso_last_updated,
-        "dateModified": iso_last_updated,
-        "author": {"@type": "Organization", "name": "eosguide"},
-        "publisher": {
-            "@type": "Organization",
-            "name": "eosguide",
-            "logo": {
-                "@type": "ImageObject",
-                "url": "https://eosguidehub.com/Circular-badge-logo.png"
-            }
-        },
-        "mainEntityOfPage": {"@type": "WebPage", "@id": f"https://eosguidehub.com/articles/{slug}.html"},
-    }
+MD_CACHE_DIR = os.path.join(".cache", "md")
 
-    graph = [breadcrumb_ld, article_ld]
+# One converter for the whole run, created on first use; reset() clears
+# per-document state between calls
+MD = None
 
-    # Add FAQ structured data only if FAQs exist
-    if faqs:
-        faq_entities = []
-        for q, a in faqs:
-            faq_entities.append({
-                "@type": "Question",
-                "name": q,
-                "acceptedAnswer": {
-                    "@type": "Answer",
-                    "text": a
-                }
-            })
+# Anything markdown could turn into something other than plain <p> text:
+# inline syntax, HTML/entities, block markers at line start, indentation,
+# trailing spaces (hard breaks) and tabs
+MD_SYNTAX_RE = re.compile(r"[\\`*_\[\]<>&!\t]|^[^\S\n]|^[#>+=|-]|^\d+[.)]|[^\S\n]$", re.M)
+PARAGRAPH_SPLIT_RE = re.compile(r"\n{2,}")
 
-        faq_ld = {
-            "@type": "FAQPage",
-            "mainEntity": faq_entities
-        }
-        graph.append(faq_ld)
 
-    structured_data = {
-        "@context": "https://schema.org",
-        "@graph": graph
-    }
+def plain_paragraphs(body: str) -> str:
+    """What markdown renders for text with no markdown syntax: one <p> per paragraph."""
+    return "\n".join(f"<p>{p}</p>" for p in PARAGRAPH_SPLIT_RE.split(body) if p)
 
-    structured_data_html = (
-        '<script type="application/ld+json">'
-        + json.dumps(structured_data, ensure_ascii=False)
-        + "</script>"
-    )
-    what_happened_html = markdown.markdown(what_happened_md) if what_happened_md else ""
-    extra_details_html = markdown.markdown(extra_details_md) if extra_details_md else ""
 
-    at_a_glance_html = build_at_a_glance(f)
-    key_dates_html = build_key_dates_table(f)
-    benefits_html = build_benefits_section(f)
-    links_html = build_links_section(f)
-    eligibility_html = build_bullets_section("Who may qualify", eligibility_items)
-    steps_html = build_steps_section("How to file", steps)
-    proof_html = build_bullets_section("Proof required", proof_items)
-    contact_html = build_contact_section(f)
-    faq_html = build_faq_section(faqs)
+@functools.lru_cache(maxsize=512)
+def md_cached(body: str) -> str:
+    """
+    Markdown -> HTML, with the result kept on disk under
+    .cache/md/<hash>.html so unchanged fields skip the markdown parser on rebuilds
+    (the publish workflow restores .cache/md between runs via actions/cache).
+    Only called for non-empty fields, so markdown is imported here rather than
+    at module load; plain prose skips it entirely.
+    """
+    global MD
+    if not MD_SYNTAX_RE.search(body):
+        return plain_paragraphs(body)
+
+    import markdown
+
+    digest = hashlib.sha256(f"{markdown.__version__}\n{body}".encode("utf-8")).hexdigest()[:16]
+    cache_path = os.path.join(MD_CACHE_DIR, f"{digest}.html")
+    if os.path.exists(cache_path):
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return f.read()
+
+    if MD is None:
+        MD = markdown.Markdown()
+    html = MD.reset().convert(body)
+    ensure_dir(MD_CACHE_DIR)
+    # Write then rename, so a reader never sees a partial file; the pid keeps
+    # build_pages() workers converting the same field off each other's temp file
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(html)
+    os.replace(tmp_path, cache_path)
+    return html
 
-    hero_html = ""
-    if hero_image:
-        credit_html = f"<p style='font-size:12px;color:var(--muted);margin-top:6px;'>{hero_credit}</p>" if hero_credit else ""
-        hero_html = f"""
-    <figure class="hero">
-      <img src="{hero_image}" alt="{title}" loading="lazy" />
-      {credit_html}
-    </figure>
-        """
 
-    meta_description = blurb.strip().replace("\n", " ")[:155].rstrip()
-    canonical = f"https://eosguidehub.com/articles/{slug}.html"
+# ─────────────────────────────────────────────────────────────────
+# MAIN PAGE BUILDER
+# ─────────────────────────────────────────────────────────────────
 
-    class_period_html = f"<p><strong>Class period:</strong> {class_period}</p>" if class_period else ""
-    payment_timing_html = f"<p>{payment_timing}</p>" if payment_timing else ""
+# Static article CSS (plain string, so no brace escaping)
+PAGE_STYLE = """  <style>
+    body { font-family: 'Montserrat', system-ui, -apple-system, sans-serif; font-weight: 400; }
+    .gradient-text { background: linear-gradient(90deg,#0891b2 0%,#7c3aed 50%,#db2777 100%); -webkit-background-clip:text; -webkit-text-fill-color:transparent; background-clip:text; }
+    .gradient-text-light { background: linear-gradient(90deg,#67e8f9 0%,#c4b5fd 50%,#f9a8d4 100%); -webkit-background-clip:text; -webkit-text-fill-color:transparent; background-clip:text; }
+    @keyframes floatSoft { 0%,100% { transform:translateY(0); } 50% { transform:translateY(-4px); } }
+    .animate-logo { animation: floatSoft 4s ease-in-out infinite; }
+    /* Article section styles */
+    .section { margin: 1.5rem 0; }
+    .section-title { font-size: 1.15rem; font-weight: 800; margin: 0 0 0.75rem; color: #111827; letter-spacing: -0.01em; border-left: 3px solid #7c3aed; padding-left: 10px; }
+    .section ul { padding-left: 1.25rem; margin: 0.5rem 0; }
+    .section ul li { margin: 8px 0; font-size: 0.95rem; color: #1f2937; line-height: 1.55; }
+    .section ol { padding-left: 1.25rem; margin: 0.5rem 0; }
+    .section ol li { margin: 10px 0; font-size: 0.95rem; color: #1f2937; line-height: 1.55; }
+    .section p { margin: 0.5rem 0; font-size: 0.95rem; color: #1f2937; line-height: 1.6; }
+    .divider { border: none; border-top: 1px solid #e5e7eb; margin: 1.5rem 0; }
 
-    what_happened_section = ""
-    if what_happened_html or class_period_html:
-        what_happened_section = f"""
-        <section class="section">
-          <h2 class="section-title">What happened</h2>
-          {class_period_html}
-          {what_happened_html}
-        </section>
-        """
+    /* Back to top button */
+    #backToTop { position:fixed; right:1.25rem; bottom:5rem; z-index:40; display:none;
+      padding: 0.5rem 0.85rem; border-radius:999px; background:#7c3aed; color:#fff;
+      font-size:12px; font-weight:700; border:none; cursor:pointer;
+      box-shadow:0 4px 14px rgba(124,58,237,0.35);
+      transition: opacity 0.2s, transform 0.2s; }
+    #backToTop:hover { background:#6d28d9; transform:translateY(-2px); }
 
-    extra_details_section = ""
-    if extra_details_html:
-        extra_details_section = f"""
-        <section class="section">
-          <h2 class="section-title">Extra details</h2>
-          {extra_details_html}
-        </section>
-        """
-
-    payment_section = ""
-    if payment_timing_html:
-        payment_section = f"""
-        <section class="section">
-          <h2 class="section-title">Payment timing</h2>
-          {payment_timing_html}
-        </section>
-        """
-
-    deadline_banner = ""
-    if f.get("deadline"):
-        claim_url = f.get("claim_form_url") or official_website
-        deadline_banner = f"""
-        <div style="background:#fefce8;border-left:4px solid #f59e0b;border-radius:0 12px 12px 0;padding:14px 16px;margin-bottom:1.5rem;">
-          <div style="display:flex;align-items:center;gap:8px;margin-bottom:10px;">
-            <svg style="width:18px;height:18px;color:#d97706;flex-shrink:0;" fill="currentColor" viewBox="0 0 20 20">
-              <path fill-rule="evenodd" d="M10 18a8 8 0 100-16 8 8 0 000 16zm1-12a1 1 0 10-2 0v4a1 1 0 00.293.707l2.828 2.829a1 1 0 101.415-1.415L11 9.586V6z" clip-rule="evenodd"/>
-            </svg>
-            <span style="font-weight:700;color:#92400e;font-size:0.9rem;">Deadline: {f["deadline"]}</span>
-          </div>
-          {"" if not claim_url else f'<a href="{claim_url}" target="_blank" rel="noopener noreferrer" style="display:inline-block;background:linear-gradient(135deg,#0EA5E9,#7C3AED);color:#fff;padding:9px 20px;border-radius:999px;font-weight:700;font-size:0.875rem;text-decoration:none;">File Your Claim →</a>'}
-        </div>"""
+    /* Mobile bottom nav */
+    .article-mobile-nav {
+      position:fixed; bottom:0; left:0; right:0; z-index:40;
+      background:rgba(255,255,255,0.97); backdrop-filter:blur(8px);
+      border-top:1px solid #e5e7eb;
+      box-shadow:0 -4px 12px rgba(15,23,42,0.06);
+      display:flex; align-items:center; justify-content:space-around; padding:0.5rem 0;
+    }
+    @media (min-width: 768px) { .article-mobile-nav { display:none; } }
+    .article-mobile-nav a, .article-mobile-nav button {
+      display:flex; flex-direction:column; align-items:center; gap:2px;
+      font-size:11px; font-weight:600; color:#6b7280; background:none; border:none;
+      cursor:pointer; padding:0.25rem 1rem; text-decoration:none; line-height:1.3;
+    }
+    .article-mobile-nav a:hover, .article-mobile-nav button:hover { color:#7c3aed; }
+
+    .table-wrap { overflow-x: auto; border: 1px solid #e5e7eb; border-radius: 14px; background: #fafaf9; }
+    .deadline-table { width: 100%; border-collapse: collapse; min-width: 500px; }
+    .deadline-table th, .deadline-table td { padding: 10px 12px; border-bottom: 1px solid #e5e7eb; text-align: left; vertical-align: top; font-size: 14px; color: #1f2937; }
+    .deadline-table th { background: #f5f5f4; color: #374151; font-weight: 700; }
+    .date-cell.urgent { color: #0891b2; font-weight: 800; }
+
+    .benefit-grid { display: grid; grid-template-columns: 1fr; gap: 12px; margin-top: 10px; }
+    .benefit-card { background: #fafaf9; border: 1px solid #e5e7eb; border-radius: 16px; padding: 14px; }
+    .benefit-card h3 { margin: 0 0 4px; font-size: 0.9rem; color: #374151; font-weight: 700; text-transform: uppercase; letter-spacing: 0.04em; }
+    .benefit-card .big { margin: 0; font-size: 1.1rem; font-weight: 800; color: #111827; }
+    .benefit-card .small { margin: 6px 0 0; color: #4b5563; font-size: 0.9rem; }
+
+    .glance-card { background: #f5f3ff; border: 1px solid #ddd6fe; border-radius: 18px; padding: 16px; margin: 16px 0; }
+    .glance-grid { display: grid; gap: 8px; }
+    .glance-row { display: grid; grid-template-columns: 130px 1fr; gap: 8px; padding: 9px 12px; border-radius: 10px; background: #ffffff; border: 1px solid #ede9fe; }
+    .glance-label { font-weight: 700; color: #4b5563; font-size: 0.88rem; padding-top: 1px; }
+    .glance-value { font-weight: 600; color: #111827; font-size: 0.95rem; overflow-wrap: anywhere; }
+    .glance-value a { color: #7c3aed; }
+
+    .bullets { padding-left: 1.25rem; }
+    .bullets li { margin: 8px 0; font-size: 0.95rem; color: #1f2937; line-height: 1.5; }
+    .steps { padding-left: 1.25rem; }
+    .steps li { margin: 10px 0; font-size: 0.95rem; color: #1f2937; line-height: 1.5; }
+
+    .callout { border-radius: 14px; padding: 14px 16px; border: 1px solid #e5e7eb; background: #fafaf9; }
+    .mini-row { margin-bottom: 6px; font-size: 0.9rem; color: #1f2937; }
+
+    .cta-row { display: flex; flex-wrap: wrap; gap: 10px; margin-top: 1.5rem; }
+    .btn { border: 1px solid #d1d5db; border-radius: 999px; padding: 10px 18px; font-weight: 700; font-size: 0.9rem; background: #fafaf9; color: #111827; display: inline-flex; align-items: center; gap: 6px; text-decoration: none; transition: all 0.2s; }
+    .btn:hover { background: #f3f4f6; text-decoration: none; }
+    .btn.primary { background: linear-gradient(135deg,#0EA5E9,#7C3AED); border: none; color: #fff; }
+    .btn.primary:hover { opacity: 0.92; }
+
+    details.faq { border: 1px solid #e5e7eb; border-radius: 14px; padding: 12px 14px; background: #fafaf9; margin: 8px 0; }
+    details.faq summary { cursor: pointer; font-weight: 700; font-size: 0.95rem; color: #111827; list-style: none; display: flex; justify-content: space-between; align-items: center; }
+    details.faq summary::-webkit-details-marker { display: none; }
+    details.faq summary::after { content: '+'; font-size: 1.2rem; color: #7c3aed; flex-shrink: 0; margin-left: 8px; }
+    details[open].faq summary::after { content: '−'; }
+    .faq-a { margin-top: 10px; color: #1f2937; font-size: 0.93rem; line-height: 1.6; padding-top: 10px; border-top: 1px solid #e5e7eb; }
+
+    @media (min-width: 768px) {
+      .benefit-grid { grid-template-columns: repeat(2, 1fr); }
+      .glance-row { grid-template-columns: 140px 1fr; }
+    }
+  </style>"""
 
-    share_buttons = f"""
-        <div class="mt-8 pt-6 border-t border-gray-200">
-          <p class="text-sm font-semibold text-gray-700 mb-3">Share this:</p>
-          <div class="flex flex-wrap gap-2 text-sm">
-            <button type="button" id="copyLinkBtn"
-              class="px-3 py-2 rounded-xl bg-gray-100 hover:bg-gray-200 transition text-gray-700 font-medium">
-              Copy link
-            </button>
-            <a class="px-3 py-2 rounded-xl bg-gray-100 hover:bg-gray-200 transition text-gray-700 font-medium"
-               target="_blank" rel="noopener"
-               href="https://twitter.com/intent/tweet?url={canonical}&text={title}">
-              X / Twitter
-            </a>
-            <a class="px-3 py-2 rounded-xl bg-gray-100 hover:bg-gray-200 transition text-gray-700 font-medium"
-               target="_blank" rel="noopener"
-               href="https://www.facebook.com/sharer/sharer.php?u={canonical}">
-              Facebook
-            </a>
-          </div>
-          <p id="copyStatus" class="text-xs text-gray-500 mt-2" aria-live="polite"></p>
-        </div>"""
+DIVIDER_HTML = """
+      <hr class="divider">
+"""
 
-    return f"""<!DOCTYPE html>
+# Page shell in str.format syntax (literal braces are doubled). It is compiled
+# into pre-encoded parts below; {body} is where the article sections go.
+PAGE_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="UTF-8">
@@ -645,7 +670,7 @@ def build_page(f: dict) -> str:
   <meta property="og:title" content="{title}">
   <meta property="og:description" content="{meta_description}">
   <meta property="og:url" content="{canonical}">
-  {"" if not hero_image else f'<meta property="og:image" content="{hero_image}">'}
+  {og_image_html}
 
   <meta name="twitter:card" content="summary_large_image">
   <meta name="twitter:title" content="{title}">
@@ -666,91 +691,7 @@ def build_page(f: dict) -> str:
   <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
   <link href="https://fonts.googleapis.com/css2?family=Montserrat:wght@300;400;500;600;700;800;900&display=swap" rel="stylesheet">
 
-  <style>
-    body {{ font-family: 'Montserrat', system-ui, -apple-system, sans-serif; font-weight: 400; }}
-    .gradient-text {{ background: linear-gradient(90deg,#0891b2 0%,#7c3aed 50%,#db2777 100%); -webkit-background-clip:text; -webkit-text-fill-color:transparent; background-clip:text; }}
-    .gradient-text-light {{ background: linear-gradient(90deg,#67e8f9 0%,#c4b5fd 50%,#f9a8d4 100%); -webkit-background-clip:text; -webkit-text-fill-color:transparent; background-clip:text; }}
-    @keyframes floatSoft {{ 0%,100% {{ transform:translateY(0); }} 50% {{ transform:translateY(-4px); }} }}
-    .animate-logo {{ animation: floatSoft 4s ease-in-out infinite; }}
-    /* Article section styles */
-    .section {{ margin: 1.5rem 0; }}
-    .section-title {{ font-size: 1.15rem; font-weight: 800; margin: 0 0 0.75rem; color: #111827; letter-spacing: -0.01em; border-left: 3px solid #7c3aed; padding-left: 10px; }}
-    .section ul {{ padding-left: 1.25rem; margin: 0.5rem 0; }}
-    .section ul li {{ margin: 8px 0; font-size: 0.95rem; color: #1f2937; line-height: 1.55; }}
-    .section ol {{ padding-left: 1.25rem; margin: 0.5rem 0; }}
-    .section ol li {{ margin: 10px 0; font-size: 0.95rem; color: #1f2937; line-height: 1.55; }}
-    .section p {{ margin: 0.5rem 0; font-size: 0.95rem; color: #1f2937; line-height: 1.6; }}
-    .divider {{ border: none; border-top: 1px solid #e5e7eb; margin: 1.5rem 0; }}
-
-    /* Back to top button */
-    #backToTop {{ position:fixed; right:1.25rem; bottom:5rem; z-index:40; display:none;
-      padding: 0.5rem 0.85rem; border-radius:999px; background:#7c3aed; color:#fff;
-      font-size:12px; font-weight:700; border:none; cursor:pointer;
-      box-shadow:0 4px 14px rgba(124,58,237,0.35);
-      transition: opacity 0.2s, transform 0.2s; }}
-    #backToTop:hover {{ background:#6d28d9; transform:translateY(-2px); }}
-
-    /* Mobile bottom nav */
-    .article-mobile-nav {{
-      position:fixed; bottom:0; left:0; right:0; z-index:40;
-      background:rgba(255,255,255,0.97); backdrop-filter:blur(8px);
-      border-top:1px solid #e5e7eb;
-      box-shadow:0 -4px 12px rgba(15,23,42,0.06);
-      display:flex; align-items:center; justify-content:space-around; padding:0.5rem 0;
-    }}
-    @media (min-width: 768px) {{ .article-mobile-nav {{ display:none; }} }}
-    .article-mobile-nav a, .article-mobile-nav button {{
-      display:flex; flex-direction:column; align-items:center; gap:2px;
-      font-size:11px; font-weight:600; color:#6b7280; background:none; border:none;
-      cursor:pointer; padding:0.25rem 1rem; text-decoration:none; line-height:1.3;
-    }}
-    .article-mobile-nav a:hover, .article-mobile-nav button:hover {{ color:#7c3aed; }}
-
-    .table-wrap {{ overflow-x: auto; border: 1px solid #e5e7eb; border-radius: 14px; background: #fafaf9; }}
-    .deadline-table {{ width: 100%; border-collapse: collapse; min-width: 500px; }}
-    .deadline-table th, .deadline-table td {{ padding: 10px 12px; border-bottom: 1px solid #e5e7eb; text-align: left; vertical-align: top; font-size: 14px; color: #1f2937; }}
-    .deadline-table th {{ background: #f5f5f4; color: #374151; font-weight: 700; }}
-    .date-cell.urgent {{ color: #0891b2; font-weight: 800; }}
-
-    .benefit-grid {{ display: grid; grid-template-columns: 1fr; gap: 12px; margin-top: 10px; }}
-    .benefit-card {{ background: #fafaf9; border: 1px solid #e5e7eb; border-radius: 16px; padding: 14px; }}
-    .benefit-card h3 {{ margin: 0 0 4px; font-size: 0.9rem; color: #374151; font-weight: 700; text-transform: uppercase; letter-spacing: 0.04em; }}
-    .benefit-card .big {{ margin: 0; font-size: 1.1rem; font-weight: 800; color: #111827; }}
-    .benefit-card .small {{ margin: 6px 0 0; color: #4b5563; font-size: 0.9rem; }}
-
-    .glance-card {{ background: #f5f3ff; border: 1px solid #ddd6fe; border-radius: 18px; padding: 16px; margin: 16px 0; }}
-    .glance-grid {{ display: grid; gap: 8px; }}
-    .glance-row {{ display: grid; grid-template-columns: 130px 1fr; gap: 8px; padding: 9px 12px; border-radius: 10px; background: #ffffff; border: 1px solid #ede9fe; }}
-    .glance-label {{ font-weight: 700; color: #4b5563; font-size: 0.88rem; padding-top: 1px; }}
-    .glance-value {{ font-weight: 600; color: #111827; font-size: 0.95rem; overflow-wrap: anywhere; }}
-    .glance-value a {{ color: #7c3aed; }}
-
-    .bullets {{ padding-left: 1.25rem; }}
-    .bullets li {{ margin: 8px 0; font-size: 0.95rem; color: #1f2937; line-height: 1.5; }}
-    .steps {{ padding-left: 1.25rem; }}
-    .steps li {{ margin: 10px 0; font-size: 0.95rem; color: #1f2937; line-height: 1.5; }}
-
-    .callout {{ border-radius: 14px; padding: 14px 16px; border: 1px solid #e5e7eb; background: #fafaf9; }}
-    .mini-row {{ margin-bottom: 6px; font-size: 0.9rem; color: #1f2937; }}
-
-    .cta-row {{ display: flex; flex-wrap: wrap; gap: 10px; margin-top: 1.5rem; }}
-    .btn {{ border: 1px solid #d1d5db; border-radius: 999px; padding: 10px 18px; font-weight: 700; font-size: 0.9rem; background: #fafaf9; color: #111827; display: inline-flex; align-items: center; gap: 6px; text-decoration: none; transition: all 0.2s; }}
-    .btn:hover {{ background: #f3f4f6; text-decoration: none; }}
-    .btn.primary {{ background: linear-gradient(135deg,#0EA5E9,#7C3AED); border: none; color: #fff; }}
-    .btn.primary:hover {{ opacity: 0.92; }}
-
-    details.faq {{ border: 1px solid #e5e7eb; border-radius: 14px; padding: 12px 14px; background: #fafaf9; margin: 8px 0; }}
-    details.faq summary {{ cursor: pointer; font-weight: 700; font-size: 0.95rem; color: #111827; list-style: none; display: flex; justify-content: space-between; align-items: center; }}
-    details.faq summary::-webkit-details-marker {{ display: none; }}
-    details.faq summary::after {{ content: '+'; font-size: 1.2rem; color: #7c3aed; flex-shrink: 0; margin-left: 8px; }}
-    details[open].faq summary::after {{ content: '−'; }}
-    .faq-a {{ margin-top: 10px; color: #1f2937; font-size: 0.93rem; line-height: 1.6; padding-top: 10px; border-top: 1px solid #e5e7eb; }}
-
-    @media (min-width: 768px) {{
-      .benefit-grid {{ grid-template-columns: repeat(2, 1fr); }}
-      .glance-row {{ grid-template-columns: 140px 1fr; }}
-    }}
-  </style>
+{style}
 </head>
 
 <body class="min-h-screen bg-gradient-to-br from-cyan-50 via-purple-50 to-pink-50">
@@ -815,48 +756,14 @@ def build_page(f: dict) -> str:
     <article class="max-w-3xl mx-auto bg-white rounded-3xl shadow-sm p-6 sm:p-8" id="main-content">
 
       <div class="mb-4 flex flex-col sm:flex-row sm:items-center sm:justify-between gap-2">
-        {"" if not f.get("deadline") else f'<div class="text-sm text-gray-700"><span class="font-semibold">Deadline:</span> {f["deadline"]}</div>'}
+        {deadline_line_html}
         <div class="text-sm text-gray-500"><span class="font-semibold">Last updated:</span> {last_updated}</div>
       </div>
 
       <h1 class="text-3xl sm:text-4xl font-black text-gray-900 mb-3 leading-tight">{title}</h1>
       <p class="text-gray-600 mb-6 italic text-base leading-relaxed">{blurb}</p>
 
-      {deadline_banner}
-
-      {hero_html}
-
-      {at_a_glance_html}
-
-      <hr class="divider">
-
-      {what_happened_section}
-
-      {benefits_html}
-
-      {key_dates_html}
-
-      {eligibility_html}
-
-      {steps_html}
-
-      {proof_html}
-
-      {payment_section}
-
-      {links_html}
-
-      {contact_html}
-
-      {extra_details_section}
-
-      {build_cta_buttons(official_website, f.get("deadline", ""))}
-
-      <hr class="divider">
-
-      {faq_html}
-
-      {build_incogni_cta(f)}
+      {body}
 
       <hr class="divider">
 
@@ -1003,24 +910,353 @@ def build_page(f: dict) -> str:
 """
 
 
-def update_articles_index(title: str, slug: str, blurb: str, last_updated: str, deadline: str = "", states: str = ""):
-    index_path = os.path.join("articles", "index.html")
-    if not os.path.exists(index_path):
-        return
+def compile_shell(template: str, **static: str) -> list[tuple[bytes, str | None]]:
+    """
+    Split a str.format template into (literal bytes, binding name) pairs.
+    Static bindings are folded into the surrounding literal text up front.
+    """
+    parts = []
+    literal = ""
+    for text, name, _, _ in string.Formatter().parse(template):
+        literal += text
+        if name in static:
+            literal += static[name]
+        elif name is not None:
+            parts.append((literal.encode("utf-8"), name))
+            literal = ""
+    parts.append((literal.encode("utf-8"), None))
+    return parts
+
+
+def render_shell(parts: list[tuple[bytes, str | None]], values: dict):
+    for literal, name in parts:
+        yield literal
+        if name is not None:
+            yield values[name].encode("utf-8")
+
+
+# The page shell before and after {body}, pre-encoded with the CSS already in place
+PAGE_HEAD_PARTS, PAGE_TAIL_PARTS = (
+    compile_shell(part, style=PAGE_STYLE) for part in PAGE_TEMPLATE.split("{body}")
+)
+
+
+def iter_page(f: dict):
+    """Yield the article page as UTF-8 chunks: head, each non-empty section, tail."""
+    title = f.get("title", "Article")
+    slug = f.get("slug", "article")
+    blurb = f.get("blurb", "")
+    last_updated = f.get("last_updated", "")
+    deadline = f.get("deadline", "")
+    official_website = f.get("official_website", "")
+    claim_form_url = f.get("claim_form_url", "")
+    hero_image = f.get("hero_image", "")
+    hero_credit = f.get("hero_credit", "")
+
+    what_happened_md = f.get("what_happened", "")
+    class_period = f.get("class_period", "")
+    payment_timing = f.get("payment_timing", "")
+    extra_details_md = f.get("extra_details", "")
+    eligible_states = f.get("eligible_states", "")
 
-    with open(index_path, "r", encoding="utf-8") as f:
-        html = f.read()
+    eligibility_items = parse_lines(f.get("eligibility", ""))
+    proof_items = parse_lines(f.get("proof_required", ""))
+    steps = parse_steps(f.get("how_to_file", ""))
+    faqs = parse_faqs(f.get("faqs", ""))
+    # Use ISO dates for schema (keeps Google happier than mixed formats)
+    iso_last_updated = to_iso_date(last_updated)
 
-    marker = "<!-- ARTICLES_LIST_INSERT_HERE -->"
-    if marker not in html:
-        return
+    # ----------------------------
+    # Structured data (JSON-LD)
+    # ----------------------------
+    breadcrumb_ld = {
+        "@type": "BreadcrumbList",
+        "itemListElement": [
+            {"@type": "ListItem", "position": 1, "name": "Home", "item": "https://eosguidehub.com/"},
+            {"@type": "ListItem", "position": 2, "name": "Articles", "item": "https://eosguidehub.com/articles/"},
+            {"@type": "ListItem", "position": 3, "name": title, "item": f"https://eosguidehub.com/articles/{slug}.html"},
+        ],
+    }
+
+    article_ld = {
+        "@type": "Article",
+        "headline": title,
+        "description": meta_description if "meta_description" in locals() else blurb.strip().replace("\n", " ")[:155].rstrip(),
+        "datePublished": iso_last_updated,
+        "dateModified": iso_last_updated,
+        "author": {"@type": "Organization", "name": "eosguide"},
+        "publisher": {
+            "@type": "Organization",
+            "name": "eosguide",
+            "logo": {
+                "@type": "ImageObject",
+                "url": "https://eosguidehub.com/Circular-badge-logo.png"
+            }
+        },
+        "mainEntityOfPage": {"@type": "WebPage", "@id": f"https://eosguidehub.com/articles/{slug}.html"},
+    }
+
+    graph = [breadcrumb_ld, article_ld]
+
+    # Add FAQ structured data only if FAQs exist
+    if faqs:
+        faq_entities = []
+        for q, a in faqs:
+            faq_entities.append({
+                "@type": "Question",
+                "name": q,
+                "acceptedAnswer": {
+                    "@type": "Answer",
+                    "text": a
+                }
+            })
+
+        faq_ld = {
+            "@type": "FAQPage",
+            "mainEntity": faq_entities
+        }
+        graph.append(faq_ld)
 
+    structured_data = {
+        "@context": "https://schema.org",
+        "@graph": graph
+    }
+
+    structured_data_html = (
+        '<script type="application/ld+json">'
+        # "<" as \u003c so field text can't close the <script> element early
+        + json.dumps(structured_data, ensure_ascii=False).replace("<", "\\u003c")
+        + "</script>"
+    )
+
+    # From here on values go into HTML (the JSON-LD above keeps the raw text).
+    # hero_credit may carry an attribution link, so it is only escaped when it
+    # has no markup at all (one "<" scan).
+    meta_description = escape_html(blurb.strip().replace("\n", " ")[:155].rstrip())
+    title = escape_html(title)
+    blurb = escape_html(blurb)
+    if "<" not in hero_credit:
+        hero_credit = escape_html(hero_credit)
+    last_updated = escape_html(last_updated)
+    hero_image = escape_html(hero_image)
+    class_period = escape_html(class_period)
+    payment_timing = escape_html(payment_timing)
+    deadline_html = escape_html(deadline)
+    canonical = escape_html(f"https://eosguidehub.com/articles/{slug}.html")
+
+    what_happened_html = md_cached(what_happened_md) if what_happened_md else ""
+    extra_details_html = md_cached(extra_details_md) if extra_details_md else ""
+
+    at_a_glance_html = build_at_a_glance(eligible_states, deadline, f.get("benefit_summary", ""), official_website)
+    # Skip builders whose source fields are all blank
+    key_dates = [f.get(k, "") for k in KEY_DATE_FIELDS]
+    key_dates_html = build_key_dates_table(*key_dates) if any(key_dates) else ""
+    benefits = f.get("benefits", "")
+    benefits_html = build_benefits_section(benefits) if benefits else ""
+    links_html = build_links_section(f) if any(f.get(k) for k, _ in LINK_FIELDS) else ""
+    eligibility_html = build_bullets_section("Who may qualify", eligibility_items)
+    steps_html = build_steps_section("How to file", steps)
+    proof_html = build_bullets_section("Proof required", proof_items)
+    contact = [f.get(k, "") for k in CONTACT_FIELDS]
+    contact_html = build_contact_section(*contact) if any(contact) else ""
+    faq_html = build_faq_section(faqs)
+
+    hero_html = ""
+    if hero_image:
+        credit_html = f"<p style='font-size:12px;color:var(--muted);margin-top:6px;'>{hero_credit}</p>" if hero_credit else ""
+        hero_html = f"""
+    <figure class="hero">
+      <img src="{hero_image}" alt="{title}" loading="lazy" />
+      {credit_html}
+    </figure>
+        """
+
+    class_period_html = f"<p><strong>Class period:</strong> {class_period}</p>" if class_period else ""
+    payment_timing_html = f"<p>{payment_timing}</p>" if payment_timing else ""
+
+    what_happened_section = ""
+    if what_happened_html or class_period_html:
+        what_happened_section = f"""
+        <section class="section">
+          <h2 class="section-title">What happened</h2>
+          {class_period_html}
+          {what_happened_html}
+        </section>
+        """
+
+    extra_details_section = ""
+    if extra_details_html:
+        extra_details_section = f"""
+        <section class="section">
+          <h2 class="section-title">Extra details</h2>
+          {extra_details_html}
+        </section>
+        """
+
+    payment_section = ""
+    if payment_timing_html:
+        payment_section = f"""
+        <section class="section">
+          <h2 class="section-title">Payment timing</h2>
+          {payment_timing_html}
+        </section>
+        """
+
+    deadline_banner = ""
+    if deadline:
+        claim_url = escape_html(claim_form_url or official_website)
+        deadline_banner = f"""
+        <div style="background:#fefce8;border-left:4px solid #f59e0b;border-radius:0 12px 12px 0;padding:14px 16px;margin-bottom:1.5rem;">
+          <div style="display:flex;align-items:center;gap:8px;margin-bottom:10px;">
+            <svg style="width:18px;height:18px;color:#d97706;flex-shrink:0;" fill="currentColor" viewBox="0 0 20 20">
+              <path fill-rule="evenodd" d="M10 18a8 8 0 100-16 8 8 0 000 16zm1-12a1 1 0 10-2 0v4a1 1 0 00.293.707l2.828 2.829a1 1 0 101.415-1.415L11 9.586V6z" clip-rule="evenodd"/>
+            </svg>
+            <span style="font-weight:700;color:#92400e;font-size:0.9rem;">Deadline: {deadline_html}</span>
+          </div>
+          {"" if not claim_url else f'<a href="{claim_url}" target="_blank" rel="noopener noreferrer" style="display:inline-block;background:linear-gradient(135deg,#0EA5E9,#7C3AED);color:#fff;padding:9px 20px;border-radius:999px;font-weight:700;font-size:0.875rem;text-decoration:none;">File Your Claim →</a>'}
+        </div>"""
+
+    share_buttons = f"""
+        <div class="mt-8 pt-6 border-t border-gray-200">
+          <p class="text-sm font-semibold text-gray-700 mb-3">Share this:</p>
+          <div class="flex flex-wrap gap-2 text-sm">
+            <button type="button" id="copyLinkBtn"
+              class="px-3 py-2 rounded-xl bg-gray-100 hover:bg-gray-200 transition text-gray-700 font-medium">
+              Copy link
+            </button>
+            <a class="px-3 py-2 rounded-xl bg-gray-100 hover:bg-gray-200 transition text-gray-700 font-medium"
+               target="_blank" rel="noopener"
+               href="https://twitter.com/intent/tweet?url={canonical}&text={title}">
+              X / Twitter
+            </a>
+            <a class="px-3 py-2 rounded-xl bg-gray-100 hover:bg-gray-200 transition text-gray-700 font-medium"
+               target="_blank" rel="noopener"
+               href="https://www.facebook.com/sharer/sharer.php?u={canonical}">
+              Facebook
+            </a>
+          </div>
+          <p id="copyStatus" class="text-xs text-gray-500 mt-2" aria-live="polite"></p>
+        </div>"""
+
+    # Article sections in page order; empty ones are dropped
+    sections = [
+        deadline_banner,
+        hero_html,
+        at_a_glance_html,
+        DIVIDER_HTML,
+        what_happened_section,
+        benefits_html,
+        key_dates_html,
+        eligibility_html,
+        steps_html,
+        proof_html,
+        payment_section,
+        links_html,
+        contact_html,
+        extra_details_section,
+        build_cta_buttons(official_website, deadline),
+        DIVIDER_HTML,
+        faq_html,
+        build_incogni_cta(f),
+    ]
+
+    values = {
+        "title": title,
+        "meta_description": meta_description,
+        "canonical": canonical,
+        "structured_data_html": structured_data_html,
+        "og_image_html": f'<meta property="og:image" content="{hero_image}">' if hero_image else "",
+        "deadline_line_html": f'<div class="text-sm text-gray-700"><span class="font-semibold">Deadline:</span> {deadline_html}</div>' if deadline else "",
+        "last_updated": last_updated,
+        "blurb": blurb,
+        "share_buttons": share_buttons,
+    }
+
+    yield from render_shell(PAGE_HEAD_PARTS, values)
+    for section in sections:
+        if section:
+            yield section.encode("utf-8")
+    yield from render_shell(PAGE_TAIL_PARTS, values)
+
+
+def build_page(f: dict) -> bytes:
+    """The whole article page as UTF-8 bytes, ready to write to disk."""
+    return b"".join(iter_page(f))
+
+
+def build_pages(field_dicts: list[dict]) -> list[bytes]:
+    """
+    build_page for several articles at once. Pages are CPU-bound and the field
+    dicts are plain strings, so they are spread across worker processes.
+    """
+    if len(field_dicts) < 2:
+        return [build_page(f) for f in field_dicts]
+    with ProcessPoolExecutor() as ex:
+        return list(ex.map(build_page, field_dicts))
+
+
+ARTICLES_DIR = "articles"
+ARTICLES_INDEX_PATH = os.path.join(ARTICLES_DIR, "index.html")
+
+
+def article_path(slug: str) -> str:
+    return os.path.join(ARTICLES_DIR, f"{slug}.html")
+
+
+# Directories already created this run, so batch mode doesn't re-stat them per article
+MADE_DIRS = set()
+
+
+def ensure_dir(path: str):
+    if path not in MADE_DIRS:
+        os.makedirs(path, exist_ok=True)
+        MADE_DIRS.add(path)
+
+
+# Buffer size for the r+b handle insert_index_cards() splices articles/index.html through
+WRITE_BUFFER_SIZE = 1 << 16
+
+
+def write_bytes(path: str, data: bytes):
+    """
+    Write an already-encoded file with raw os.write calls (no io buffering layer).
+    The bytes go to a temp file that then replaces path, so a failed write never
+    leaves a truncated file behind.
+    """
+    tmp_path = path + ".tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
+INDEX_CARD_TEMPLATE = """
+        <article class="py-5 group">
+          <div style="display:flex;flex-wrap:wrap;align-items:center;gap:8px;margin-bottom:6px;">
+            {state_badge}
+            {urgency_badge}
+          </div>
+          <h2 style="font-size:16px;font-weight:700;color:#111827;line-height:1.35;margin:0 0 4px;">
+            <a href="/articles/{slug}.html" style="color:inherit;text-decoration:none;" onmouseover="this.style.color='#7c3aed'" onmouseout="this.style.color='#111827'">{title}</a>
+          </h2>
+          <p style="font-size:11px;color:#9ca3af;font-weight:500;margin:0 0 6px;">{deadline_str}Updated {last_updated}</p>
+          <p style="font-size:14px;color:#4b5563;line-height:1.6;margin:0 0 8px;">{blurb}</p>
+          <a href="/articles/{slug}.html" style="display:inline-block;font-size:12px;font-weight:700;color:#7c3aed;text-decoration:none;">Read guide →</a>
+        </article>
+    """
+
+
+def build_index_card(title: str, slug: str, blurb: str, last_updated: str, deadline: str = "", states: str = "") -> str:
+    """Listing card for articles/index.html."""
     # Determine urgency badge
     urgency_badge = ""
     if deadline:
         try:
-            from datetime import datetime, timezone
-            d = datetime.strptime(deadline, "%B %d, %Y").date() if not re.match(r"^\d{4}-\d{2}-\d{2}$", deadline) else datetime.strptime(deadline, "%Y-%m-%d").date()
+            d = datetime.strptime(deadline, "%B %d, %Y").date() if not ISO_DATE_RE.match(deadline) else datetime.strptime(deadline, "%Y-%m-%d").date()
             dl = (d - datetime.now(timezone.utc).date()).days
             if dl <= 7:
                 urgency_badge = f'<span style="display:inline-flex;align-items:center;padding:2px 9px;border-radius:999px;font-size:11px;font-weight:700;background:linear-gradient(135deg,#ef4444,#ec4899);color:#fff;">🔥 {dl}d left</span>'
@@ -1032,32 +1268,51 @@ def update_articles_index(title: str, slug: str, blurb: str, last_updated: str,
             pass
 
     # State badge
-    state_list = [s.strip() for s in re.split(r"[\n,]+", states) if s.strip() and s.strip() != "_No response_"] if states else []
-    is_national = not state_list or any(s.lower() == "nationwide" for s in state_list)
-    state_label = "🌐 Nationwide" if is_national else f"📍 {state_list[0]}"
+    state_list = normalize_states(states)
+    is_national = not state_list or state_list == ["Nationwide"]
+    state_label = "🌐 Nationwide" if is_national else f"📍 {escape_html(state_list[0])}"
     state_badge = f'<span style="display:inline-flex;align-items:center;padding:3px 10px;border-radius:999px;font-size:11px;font-weight:600;color:#4b5563;background:#f3f4f6;">{state_label}</span>'
 
+    # Card text is escaped here, once; the urgency badge above only needs the
+    # raw deadline for date parsing
+    title, slug, blurb, last_updated, deadline = (escape_html(v) for v in (title, slug, blurb, last_updated, deadline))
     deadline_str = f"Deadline: {deadline} · " if deadline else ""
 
-    entry = f"""
-        <article class="py-5 group">
-          <div style="display:flex;flex-wrap:wrap;align-items:center;gap:8px;margin-bottom:6px;">
-            {state_badge}
-            {urgency_badge}
-          </div>
-          <h2 style="font-size:16px;font-weight:700;color:#111827;line-height:1.35;margin:0 0 4px;">
-            <a href="/articles/{slug}.html" style="color:inherit;text-decoration:none;" onmouseover="this.style.color='#7c3aed'" onmouseout="this.style.color='#111827'">{title}</a>
-          </h2>
-          <p style="font-size:11px;color:#9ca3af;font-weight:500;margin:0 0 6px;">{deadline_str}Updated {last_updated}</p>
-          <p style="font-size:14px;color:#4b5563;line-height:1.6;margin:0 0 8px;">{blurb}</p>
-          <a href="/articles/{slug}.html" style="display:inline-block;font-size:12px;font-weight:700;color:#7c3aed;text-decoration:none;">Read guide →</a>
-        </article>
-    """
+    return INDEX_CARD_TEMPLATE.format(
+        state_badge=state_badge,
+        urgency_badge=urgency_badge,
+        slug=slug,
+        title=title,
+        deadline_str=deadline_str,
+        last_updated=last_updated,
+        blurb=blurb,
+    )
+
+
+def insert_index_cards(cards: list[str]):
+    """Insert cards (newest first) after the list marker in articles/index.html."""
+    # Splice the cards in right after the marker through one r+b handle; only the
+    # bytes after it are rewritten
+    marker = b"<!-- ARTICLES_LIST_INSERT_HERE -->"
+    try:
+        f = open(ARTICLES_INDEX_PATH, "r+b", buffering=WRITE_BUFFER_SIZE)
+    except FileNotFoundError:
+        return
+    with f:
+        data = f.read()
+        pos = data.find(marker)
+        if pos < 0:
+            return
+        insert_at = pos + len(marker)
+        f.seek(insert_at)
+        f.write("".join(cards).encode("utf-8"))
+        f.write(data[insert_at:])
+
+
+def update_articles_index(title: str, slug: str, blurb: str, last_updated: str, deadline: str = "", states: str = ""):
+    insert_index_cards([build_index_card(title, slug, blurb, last_updated, deadline, states)])
 
-    html = html.replace(marker, marker + entry)
 
-    with open(index_path, "w", encoding="utf-8") as f:
-        f.write(html)
 def to_iso_date(date_str: str) -> str:
     """
     Converts common date formats to ISO YYYY-MM-DD for sitemap <lastmod>.
@@ -1069,7 +1324,7 @@ def to_iso_date(date_str: str) -> str:
     s = date_str.strip()
 
     # Already ISO
-    if re.match(r"^\d{4}-\d{2}-\d{2}$", s):
+    if ISO_DATE_RE.match(s):
         return s
 
     # Common human-readable formats
@@ -1084,6 +1339,11 @@ def to_iso_date(date_str: str) -> str:
 
 
 def update_sitemap(slug: str, last_updated: str):
+    update_sitemap_entries([(slug, last_updated)])
+
+
+def update_sitemap_entries(entries: list[tuple[str, str]]):
+    """Add a <url> per (slug, last_updated) pair, reading and writing sitemap.xml once."""
     sitemap_path = "sitemap.xml"
 
     # If you don't have a sitemap yet, do nothing.
@@ -1093,89 +1353,197 @@ def update_sitemap(slug: str, last_updated: str):
     with open(sitemap_path, "r", encoding="utf-8") as f:
         xml = f.read()
 
-    article_url = f"https://eosguidehub.com/articles/{slug}.html"
+    new_entries = []
+    for slug, last_updated in entries:
+        article_url = f"https://eosguidehub.com/articles/{slug}.html"
 
-    # Don’t add duplicates
-    if article_url in xml:
-        return
+        # Don’t add duplicates
+        if article_url in xml or any(article_url in e for e in new_entries):
+            continue
 
-    lastmod = to_iso_date(last_updated)
+        lastmod = to_iso_date(last_updated)
 
-    new_entry = f"""
+        new_entries.append(f"""
   <url>
     <loc>{article_url}</loc>
     <lastmod>{lastmod}</lastmod>
     <changefreq>monthly</changefreq>
     <priority>0.8</priority>
   </url>
-"""
+""")
 
     # Insert before closing tag
-    if "</urlset>" not in xml:
+    if not new_entries or "</urlset>" not in xml:
         return
 
-    xml = xml.replace("</urlset>", new_entry + "</urlset>")
+    xml = xml.replace("</urlset>", "".join(new_entries) + "</urlset>", 1)
 
     with open(sitemap_path, "w", encoding="utf-8") as f:
         f.write(xml)
 
-def main():
+
+# Issue form label for each field key. Labels contain spaces, so Python won't
+# intern them on its own; interning both these and the parsed headings lets
+# main()'s lookups match on identity.
+FIELD_LABELS = {key: sys.intern(label) for key, label in (
+    ("title", "Article title"),
+    ("slug", "URL slug"),
+    ("blurb", "Short blurb (used on listing page + near top of article)"),
+    ("last_updated", "Last updated"),
+    ("eligible_states", "Eligible states / location"),
+    ("official_website", "Official website"),
+    ("claim_form_url", "Claim form URL (optional)"),
+    ("important_dates_url", "Important dates URL (optional)"),
+    ("faqs_url", "FAQs URL (optional)"),
+    ("documents_url", "Documents URL (optional)"),
+    ("hero_image", "Hero image URL (optional)"),
+    ("hero_credit", "Hero image credit (optional)"),
+    ("what_happened", "What happened (optional)"),
+    ("benefit_summary", "Benefit summary (optional)"),
+    ("benefits", "Benefits list (optional)"),
+    ("deadline", "Main deadline (optional)"),
+    ("optout_deadline", "Opt-out deadline (optional)"),
+    ("objection_deadline", "Objection deadline (optional)"),
+    ("hearing_date", "Final approval hearing (optional)"),
+    ("eligibility", "Who may qualify (optional checklist)"),
+    ("class_period", "Class period (optional)"),
+    ("how_to_file", "How to file (optional steps)"),
+    ("proof_required", "Proof required (optional)"),
+    ("payment_timing", "Payment timing / method (optional)"),
+    ("admin_phone", "Administrator phone (optional)"),
+    ("admin_email", "Administrator email (optional)"),
+    ("admin_address", "Administrator mailing address (optional)"),
+    ("extra_details", "Extra details (optional)"),
+    ("faqs", "FAQs (optional)"),
+)}
+
+
+# Digest of the last published issue body per slug, to skip no-op re-runs
+HASHES_DIR = os.path.join(ARTICLES_DIR, ".hashes")
+
+
+def issue_digest(issue_body: str) -> str:
+    """Hash of the issue body plus this script, so generator changes still republish."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(__file__, "rb") as f:
+        h.update(f.read())
+    h.update(issue_body.encode("utf-8"))
+    return h.hexdigest()
+
+
+def read_issue_body() -> str:
+    """Issue body with line endings normalized ("" if neither source is set)."""
     # Prefer ISSUE_BODY, but your workflow writes the body to a file, so support both.
     issue_body = os.environ.get("ISSUE_BODY", "").strip()
-    if not issue_body:
-        path = os.environ.get("ISSUE_BODY_PATH", "").strip()
-        if path and os.path.exists(path):
-            with open(path, "r", encoding="utf-8") as f:
-                issue_body = f.read().strip()
+    if issue_body:
+        return issue_body.replace("\r\n", "\n").replace("\r", "\n")
+
+    return read_issue_body_file(os.environ.get("ISSUE_BODY_PATH", "").strip())
+
+
+def read_issue_body_file(path: str) -> str:
+    """Issue body saved at path, line endings normalized ("" if missing)."""
+    if path and os.path.exists(path):
+        # Normalize on the raw bytes, then decode once
+        with open(path, "rb") as f:
+            raw = f.read()
+        return raw.replace(b"\r\n", b"\n").replace(b"\r", b"\n").decode("utf-8").strip()
+    return ""
+
+
+def fields_from_body(issue_body: str) -> dict[str, str]:
+    all_fields = parse_all_fields(issue_body)
+    return {key: all_fields.get(label, "") for key, label in FIELD_LABELS.items()}
+
+
+def is_unchanged(slug: str, digest: str) -> bool:
+    """True if articles/<slug>.html was last published from the same digest."""
+    out_path = article_path(slug)
+    hash_path = os.path.join(HASHES_DIR, slug)
+    if os.path.exists(out_path) and os.path.exists(hash_path):
+        with open(hash_path, "r", encoding="utf-8") as f:
+            return f.read().strip() == digest
+    return False
+
+
+def save_digest(slug: str, digest: str):
+    ensure_dir(HASHES_DIR)
+    hash_path = os.path.join(HASHES_DIR, slug)
+    tmp_path = hash_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(digest + "\n")
+    os.replace(tmp_path, hash_path)
+
+
+def main():
+    issue_body = read_issue_body()
     if not issue_body:
         raise SystemExit("Missing ISSUE_BODY (and ISSUE_BODY_PATH was empty/unreadable)")
 
-    issue_body = issue_body.replace('\r\n', '\n').replace('\r', '\n')  # ← ADD THIS LINE
-
-    fields = {
-        "title": get_field(issue_body, "Article title"),
-        "slug": get_field(issue_body, "URL slug"),
-        "blurb": get_field(issue_body, "Short blurb (used on listing page + near top of article)"),
-        "last_updated": get_field(issue_body, "Last updated"),
-        "eligible_states": get_field(issue_body, "Eligible states / location"),
-        "official_website": get_field(issue_body, "Official website"),
-        "claim_form_url": get_field(issue_body, "Claim form URL (optional)"),
-        "important_dates_url": get_field(issue_body, "Important dates URL (optional)"),
-        "faqs_url": get_field(issue_body, "FAQs URL (optional)"),
-        "documents_url": get_field(issue_body, "Documents URL (optional)"),
-        "hero_image": get_field(issue_body, "Hero image URL (optional)"),
-        "hero_credit": get_field(issue_body, "Hero image credit (optional)"),
-        "what_happened": get_field(issue_body, "What happened (optional)"),
-        "benefit_summary": get_field(issue_body, "Benefit summary (optional)"),
-        "benefits": get_field(issue_body, "Benefits list (optional)"),
-        "deadline": get_field(issue_body, "Main deadline (optional)"),
-        "optout_deadline": get_field(issue_body, "Opt-out deadline (optional)"),
-        "objection_deadline": get_field(issue_body, "Objection deadline (optional)"),
-        "hearing_date": get_field(issue_body, "Final approval hearing (optional)"),
-        "eligibility": get_field(issue_body, "Who may qualify (optional checklist)"),
-        "class_period": get_field(issue_body, "Class period (optional)"),
-        "how_to_file": get_field(issue_body, "How to file (optional steps)"),
-        "proof_required": get_field(issue_body, "Proof required (optional)"),
-        "payment_timing": get_field(issue_body, "Payment timing / method (optional)"),
-        "admin_phone": get_field(issue_body, "Administrator phone (optional)"),
-        "admin_email": get_field(issue_body, "Administrator email (optional)"),
-        "admin_address": get_field(issue_body, "Administrator mailing address (optional)"),
-        "extra_details": get_field(issue_body, "Extra details (optional)"),
-        "faqs": get_field(issue_body, "FAQs (optional)"),
-    }
+    fields = fields_from_body(issue_body)
 
     slug = fields.get("slug") or "article"
-    out_path = os.path.join("articles", f"{slug}.html")
+    out_path = article_path(slug)
 
-    page_html = build_page(fields)
+    digest = issue_digest(issue_body)
+    if is_unchanged(slug, digest):
+        print(f"Unchanged: {out_path}")
+        return
 
-    with open(out_path, "w", encoding="utf-8") as f:
-        f.write(page_html)
+    # Render fully before touching the old page, so a failure mid-render leaves
+    # the previously published page in place
+    write_bytes(out_path, build_page(fields))
 
     update_articles_index(fields["title"], slug, fields["blurb"], fields["last_updated"], fields.get("deadline", ""), fields.get("eligible_states", ""))
     update_sitemap(slug, fields.get("last_updated", ""))
+
+    save_digest(slug, digest)
     print(f"Published: {out_path}")
 
 
+def main_batch(paths: list[str]):
+    """
+    Publish several saved issue bodies in one run. Pages are built together via
+    build_pages(), and articles/index.html and sitemap.xml are each written once.
+    Paths are oldest first, so the index ends up in the same order as running
+    main() once per path.
+    """
+    todo = []
+    for path in paths:
+        issue_body = read_issue_body_file(path)
+        if not issue_body:
+            print(f"Skipped (empty/unreadable): {path}")
+            continue
+        fields = fields_from_body(issue_body)
+        slug = fields.get("slug") or "article"
+        digest = issue_digest(issue_body)
+        if is_unchanged(slug, digest):
+            print(f"Unchanged: {article_path(slug)}")
+            continue
+        todo.append((fields, slug, digest))
+
+    if not todo:
+        return
+
+    pages = build_pages([fields for fields, _, _ in todo])
+    for (_, slug, _), page in zip(todo, pages):
+        write_bytes(article_path(slug), page)
+
+    insert_index_cards([
+        build_index_card(fields["title"], slug, fields["blurb"], fields["last_updated"], fields.get("deadline", ""), fields.get("eligible_states", ""))
+        for fields, slug, _ in reversed(todo)
+    ])
+    update_sitemap_entries([(slug, fields.get("last_updated", "")) for fields, slug, _ in todo])
+
+    for fields, slug, digest in todo:
+        save_digest(slug, digest)
+        print(f"Published: {article_path(slug)}")
+
+
 if __name__ == "__main__":
-    main()
+    # ISSUE_BODY_PATHS (os.pathsep-separated) publishes a batch; otherwise one issue
+    batch_paths = [p.strip() for p in os.environ.get("ISSUE_BODY_PATHS", "").split(os.pathsep) if p.strip()]
+    if batch_paths:
+        main_batch(batch_paths)
+    else:
+        main()